@@ -1,3 +1,5 @@
+import csv
+
 import pytest
 
 from yfc import _data_operations as dops
@@ -7,3 +9,32 @@ from yfc._exceptions import BadTickersFormatError
 def test__get_ticker_string_from_list__string__raises():
     with pytest.raises(BadTickersFormatError):
         dops.get_ticker_string_from_list('a string')
+
+
+def test__get_checkpoint_path__uppercases_ticker(tmpdir):
+    path = dops.get_checkpoint_path(str(tmpdir), 'aapl')
+    assert path == str(tmpdir.join('AAPL.csv'))
+
+
+def test__write_checkpoint__read_checkpoint__roundtrip(tmpdir):
+    answer_list = [['Date', 'Close', 'Adj Close'],
+                   ['2016-01-05', '2.0', '2.5'],
+                   ['2016-01-04', '1.0', '1.5']]
+    df = dops.historical_pd_dataframe(answer_list)
+    path = dops.get_checkpoint_path(str(tmpdir), 'COP')
+
+    dops.write_checkpoint(df, path)
+
+    assert not tmpdir.join('COP.csv.tmp').check()
+    restored = dops.read_checkpoint(path)
+    assert list(restored.columns) == list(df.columns)
+    assert list(restored.index) == list(df.index)
+    assert restored['Adj Close'].tolist() == df['Adj Close'].tolist()
+
+
+def test__write_error_report__lists_failed_tickers(tmpdir):
+    path = str(tmpdir.join('errors.csv'))
+    dops.write_error_report([('BAD', 'No historical data')], path)
+
+    with open(path) as report:
+        assert list(csv.reader(report)) == [['ticker', 'error'], ['BAD', 'No historical data']]
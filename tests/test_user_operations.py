@@ -0,0 +1,117 @@
+import csv
+
+import pandas as pd
+
+from yfc import _data_operations as dops
+from yfc import user_operations as uops
+
+
+def make_historical(closes):
+    answer_list = [['Date', 'Close', 'Adj Close']]
+    answer_list += [[date, str(close), str(close)] for date, close in closes]
+    return dops.historical_pd_dataframe(answer_list)
+
+
+HISTORICALS = {
+    'AAA': make_historical([('2016-01-04', 1.0), ('2016-01-05', 2.0)]),
+    'BBB': make_historical([('2016-01-04', 3.0), ('2016-01-05', 4.0)]),
+}
+
+
+def fake_historical(calls):
+    def historical(ticker, *args, **kwargs):
+        calls.append(ticker)
+        if ticker == 'BAD':
+            raise ValueError('bad response')
+        return HISTORICALS.get(ticker)
+    return historical
+
+
+def read_errors(checkpoint_dir):
+    with open(str(checkpoint_dir.join('errors.csv'))) as report:
+        return list(csv.DictReader(report))
+
+
+def test__mult_historical__checkpoint__failing_ticker_reported_others_joined(monkeypatch, tmpdir):
+    monkeypatch.setattr(uops, 'historical', fake_historical([]))
+
+    result = uops.mult_historical(['AAA', 'BAD', 'BBB'], checkpoint_dir=str(tmpdir))
+
+    assert list(result.columns) == ['AAA', 'BBB']
+    errors = read_errors(tmpdir)
+    assert [row['ticker'] for row in errors] == ['BAD']
+    assert 'bad response' in errors[0]['error']
+
+
+def test__mult_historical__checkpoint__none_reported_as_no_data(monkeypatch, tmpdir):
+    monkeypatch.setattr(uops, 'historical', fake_historical([]))
+
+    result = uops.mult_historical(['AAA', 'NODATA'], checkpoint_dir=str(tmpdir))
+
+    assert list(result.columns) == ['AAA']
+    assert read_errors(tmpdir) == [{'ticker': 'NODATA', 'error': 'No historical data'}]
+
+
+def test__mult_historical__checkpoint__resume_retries_only_failed(monkeypatch, tmpdir):
+    calls = []
+    monkeypatch.setattr(uops, 'historical', fake_historical(calls))
+    tickers = ['AAA', 'BAD', 'BBB']
+
+    first = uops.mult_historical(tickers, checkpoint_dir=str(tmpdir))
+    del calls[:]
+    second = uops.mult_historical(tickers, checkpoint_dir=str(tmpdir))
+
+    assert calls == ['BAD']
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test__mult_historical__checkpoint__same_result_as_without(monkeypatch, tmpdir):
+    monkeypatch.setattr(uops, 'historical', fake_historical([]))
+    tickers = ['AAA', 'NODATA', 'BBB']
+
+    plain = uops.mult_historical(tickers)
+    checkpointed = uops.mult_historical(tickers, checkpoint_dir=str(tmpdir))
+    resumed = uops.mult_historical(tickers, checkpoint_dir=str(tmpdir))
+
+    pd.testing.assert_frame_equal(plain, checkpointed)
+    pd.testing.assert_frame_equal(plain, resumed)
+
+
+def test__mult_historical__checkpoint__all_failed_returns_empty(monkeypatch, tmpdir):
+    monkeypatch.setattr(uops, 'historical', fake_historical([]))
+
+    result = uops.mult_historical(['BAD', 'NODATA'], checkpoint_dir=str(tmpdir))
+
+    assert result.empty
+    assert [row['ticker'] for row in read_errors(tmpdir)] == ['BAD', 'NODATA']
+
+
+def test__mult_historical__checkpoint__bad_checkpoint_downloaded_again(monkeypatch, tmpdir):
+    calls = []
+    monkeypatch.setattr(uops, 'historical', fake_historical(calls))
+    tmpdir.join('AAA.csv').write('')
+    tmpdir.join('BBB.csv').write('Date,Close\n2016-01-04,3.0\n')
+
+    result = uops.mult_historical(['AAA', 'BBB'], checkpoint_dir=str(tmpdir))
+
+    assert calls == ['AAA', 'BBB']
+    assert list(result.columns) == ['AAA', 'BBB']
+    errors = read_errors(tmpdir)
+    assert [row['ticker'] for row in errors] == ['AAA', 'BBB']
+    assert all(row['error'].startswith('Bad checkpoint') for row in errors)
+    assert 'Adj Close' in dops.read_checkpoint(str(tmpdir.join('BBB.csv'))).columns
+
+
+def test__mult_historical__checkpoint__failed_write_keeps_data(monkeypatch, tmpdir):
+    def write_checkpoint(pandas_dataframe, checkpoint_path):
+        raise IOError('disk full')
+
+    monkeypatch.setattr(uops, 'historical', fake_historical([]))
+    monkeypatch.setattr(dops, 'write_checkpoint', write_checkpoint)
+
+    result = uops.mult_historical(['AAA', 'BBB'], checkpoint_dir=str(tmpdir))
+
+    assert list(result.columns) == ['AAA', 'BBB']
+    errors = read_errors(tmpdir)
+    assert [row['ticker'] for row in errors] == ['AAA', 'BBB']
+    assert all('disk full' in row['error'] for row in errors)
@@ -1,5 +1,6 @@
 import csv
 import os
+import sys
 
 import requests
 import pandas as pd
@@ -208,3 +209,58 @@ def historical_pd_dataframe(answer_list):
             print(colname, 'could not be converted.')
 
     return pandas_dataframe
+
+
+def get_checkpoint_path(checkpoint_dir, ticker):
+    """Returns the path of the checkpoint csv file for a ticker."""
+    return os.path.join(checkpoint_dir, ticker.upper() + '.csv')
+
+
+def write_checkpoint(pandas_dataframe, checkpoint_path):
+    """Writes a historical DataFrame to a checkpoint csv file.
+
+    The DataFrame is written to a temporary file first and then renamed,
+    so an interrupted write never leaves a truncated checkpoint behind.
+
+    :param pandas_dataframe: historical DataFrame indexed by date
+    :param checkpoint_path: string, path to the checkpoint csv file
+    """
+    temp_path = checkpoint_path + '.tmp'
+    pandas_dataframe.to_csv(temp_path)
+    os.rename(temp_path, checkpoint_path)
+
+
+def read_checkpoint(checkpoint_path):
+    """Reads a historical DataFrame back from a checkpoint csv file.
+
+    :param checkpoint_path: string, path to the checkpoint csv file
+
+    :return: a pandas DataFrame indexed by date
+    """
+    pandas_dataframe = pd.read_csv(checkpoint_path, index_col=0, parse_dates=True)
+    check_historical_columns(pandas_dataframe)
+    return pandas_dataframe
+
+
+def check_historical_columns(pandas_dataframe):
+    """Raises ValueError if a historical DataFrame lacks the 'Adj Close' column."""
+    if 'Adj Close' not in pandas_dataframe.columns:
+        raise ValueError("historical data has no 'Adj Close' column")
+
+
+def write_error_report(errors, error_report_path):
+    """Writes the tickers that failed to download to a csv file.
+
+    :param errors: list of (ticker, error message) tuples
+    :param error_report_path: string, path to the error report csv file (overwrites existing file)
+    """
+    # the csv module needs a binary file on Python 2 and newline='' on Python 3
+    if sys.version_info[0] < 3:
+        report_file = open(error_report_path, 'wb')
+    else:
+        report_file = open(error_report_path, 'w', newline='')
+
+    with report_file as report:
+        writer = csv.writer(report)
+        writer.writerow(['ticker', 'error'])
+        writer.writerows(errors)
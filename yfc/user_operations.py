@@ -1,3 +1,7 @@
+import os
+
+import pandas as pd
+
 from . import _data_operations as dataops
 from ._exceptions import BadTickersFormatError
 
@@ -67,7 +71,7 @@ def historical(ticker, from_date=None, to_date=None, write_to_csv=False, result_
     return pandas_dataframe
 
 
-def mult_historical(tickers, write_to_csv=False, result_csv_path=None, how='outer'):
+def mult_historical(tickers, write_to_csv=False, result_csv_path=None, how='outer', checkpoint_dir=None):
     """Returns a Pandas dataframe with historical data for multiple tickers side by side.
 
     :param tickers: list of tickers or path to ticker csv file
@@ -75,7 +79,13 @@ def mult_historical(tickers, write_to_csv=False, result_csv_path=None, how='oute
             if set to `True` (`False` is default)
     :param result_csv_path: string, specifies path to csv file to write the data (overwrites existing file)
     :param how: specifies how the join should be made (outer join by default)
-    :return: a pandas `DataFrame`
+    :param checkpoint_dir: string, directory to save each downloaded ticker to (`None` is default);
+            when set, tickers already saved there are not downloaded again, and tickers that fail
+            are skipped and listed in `errors.csv` inside the directory, so an interrupted run
+            can be resumed by calling `mult_historical` again with the same arguments;
+            checkpoints never expire, so reusing the directory on a later date returns the
+            data saved by the earlier run (use a fresh directory to get up-to-date data)
+    :return: a pandas `DataFrame` (empty if no ticker returned any data)
     """
 
     try:
@@ -91,11 +101,23 @@ def mult_historical(tickers, write_to_csv=False, result_csv_path=None, how='oute
 
         # TODO move all the reshaping business to dataops
         # get historical data for each ticker in ticker_list
-        full_dfs = [historical(ticker) for ticker in ticker_list]
+        if checkpoint_dir is None:
+            full_dfs = [historical(ticker) for ticker in ticker_list]
+        else:
+            full_dfs = _checkpointed_historicals(ticker_list, checkpoint_dir)
 
         # throw out the Nones
         not_nones = [(ticker, df) for ticker, df in zip(ticker_list, full_dfs) if df is not None]
 
+        # every ticker failed or had no data, there is nothing to join
+        if not not_nones:
+            if checkpoint_dir is None:
+                print('No historical data for any of the tickers.')
+            else:
+                print('No historical data for any of the tickers, see',
+                      os.path.join(checkpoint_dir, 'errors.csv'))
+            return pd.DataFrame()
+
         # use only the 'Close' column
         adj_close_only = [(ticker, df[['Adj Close']]) for ticker, df in not_nones]
 
@@ -115,3 +137,61 @@ def mult_historical(tickers, write_to_csv=False, result_csv_path=None, how='oute
             result.to_csv(result_csv_path)
 
         return result
+
+
+def _checkpointed_historicals(ticker_list, checkpoint_dir):
+    """Retrieves historical data for each ticker, saving every completed download to disk.
+
+    Tickers with an existing checkpoint in `checkpoint_dir` are read from disk instead of
+    being requested again. A ticker that fails to download or parse is skipped (its slot
+    in the result is `None`) and recorded in `errors.csv` inside `checkpoint_dir`, which
+    is rewritten on every call so it only lists failures from the latest run. A checkpoint
+    that cannot be read is recorded there as well and the ticker is downloaded again; a
+    checkpoint that cannot be written is recorded, but the downloaded data is still used.
+
+    :param ticker_list: list of tickers
+    :param checkpoint_dir: string, directory to keep checkpoints and the error report in
+    :return: a list of pandas `DataFrame`s (or `None`s) in the order of `ticker_list`
+    """
+
+    if not os.path.isdir(checkpoint_dir):
+        os.makedirs(checkpoint_dir)
+
+    full_dfs = []
+    errors = []
+    for ticker in ticker_list:
+        checkpoint_path = dataops.get_checkpoint_path(checkpoint_dir, ticker)
+        if os.path.exists(checkpoint_path):
+            try:
+                pandas_dataframe = dataops.read_checkpoint(checkpoint_path)
+            except Exception as err:
+                print('Bad checkpoint for', ticker)
+                errors.append((ticker, 'Bad checkpoint: ' + repr(err)))
+            else:
+                print('Loaded checkpoint for', ticker)
+                full_dfs.append(pandas_dataframe)
+                continue
+
+        try:
+            pandas_dataframe = historical(ticker)
+            if pandas_dataframe is not None:
+                dataops.check_historical_columns(pandas_dataframe)
+        except Exception as err:
+            print('Failed to get data for', ticker)
+            errors.append((ticker, repr(err)))
+            full_dfs.append(None)
+            continue
+
+        if pandas_dataframe is None:
+            errors.append((ticker, 'No historical data'))
+        else:
+            try:
+                dataops.write_checkpoint(pandas_dataframe, checkpoint_path)
+            except Exception as err:
+                print('Failed to save checkpoint for', ticker)
+                errors.append((ticker, 'Checkpoint not saved: ' + repr(err)))
+        full_dfs.append(pandas_dataframe)
+
+    dataops.write_error_report(errors, os.path.join(checkpoint_dir, 'errors.csv'))
+
+    return full_dfs